@@ -1,6 +1,7 @@
-from dataclasses import asdict, dataclass
+import re
 from enum import Enum
-from inspect import Parameter, getmembers, isfunction, signature
+from functools import lru_cache
+from inspect import Parameter, Signature, isfunction, signature
 from typing import (
     Any,
     Callable,
@@ -9,31 +10,50 @@ from typing import (
     Optional,
     ParamSpec,
     Sequence,
-    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 
 from fastapi import APIRouter, Depends, FastAPI, Response
-from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.datastructures import Default
 from fastapi.params import Depends
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from fastapi.types import DecoratedCallable
 from fastapi.utils import generate_unique_id
-from starlette.routing import BaseRoute, Route
+from starlette.routing import BaseRoute
 from starlette.types import ASGIApp
 
-from .di import factory, inject
+from .di import compile_factory, inject, resolve_dependencies
 
 ROUTER_KEY = "__api_router__"
 ENDPOINT_KEY = "__endpoint_api_key__"
 
 
+@lru_cache(maxsize=None)
+def _optional_trailing_slash_route(route_class: Type[APIRoute]) -> Type[APIRoute]:
+    """
+    Returns a subclass of `route_class` whose routes also match their path
+    followed by a trailing slash. The behavior lives in the route class so
+    it is kept when the router is included in another router or app.
+    """
+
+    class OptionalTrailingSlashRoute(route_class):  # type: ignore
+        def __init__(self, path: str, *args: Any, **kwargs: Any) -> None:
+            super().__init__(path, *args, **kwargs)
+            if not path.endswith("/"):
+                pattern = self.path_regex.pattern
+                self.path_regex = re.compile(pattern[:-1] + "/?$")
+
+    return OptionalTrailingSlashRoute
+
+
 class APIControllerRouter(APIRouter):
     """
-    Registers endpoints for both a non-trailing-slash and a trailing slash.
+    Registers endpoints for both a non-trailing-slash and a trailing slash,
+    using a single route that matches both.
     In regards to the exported API schema only the non-trailing slash will be included.
     Examples:
         @router.get("", include_in_schema=False) - not included in the OpenAPI schema,
@@ -50,28 +70,28 @@ class APIControllerRouter(APIRouter):
         path: str,
         *,
         include_in_schema: bool = True,
-        **kwargs: Dict[str, Any],
+        **kwargs: Any,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         given_path = path
         path_no_slash = given_path[:-1] if given_path.endswith("/") else given_path
 
-        add_nontrailing_slash_path = super().api_route(
-            path_no_slash, include_in_schema=include_in_schema, **kwargs
-        )
+        if given_path == "/":
+            path_no_slash = given_path
+            include_in_schema = False
 
-        add_trailing_slash_path = super().api_route(
-            path_no_slash + "/", include_in_schema=False, **kwargs
-        )
+        route_class = _optional_trailing_slash_route(self.route_class)
 
         def add_path_and_trailing_slash(func: DecoratedCallable) -> DecoratedCallable:
-            add_trailing_slash_path(func)
-            return add_nontrailing_slash_path(func)
+            self.add_api_route(
+                path_no_slash,
+                func,
+                include_in_schema=include_in_schema,
+                route_class_override=route_class,
+                **kwargs,
+            )
+            return func
 
-        return (
-            add_trailing_slash_path
-            if given_path == "/"
-            else add_path_and_trailing_slash
-        )
+        return add_path_and_trailing_slash
 
 
 class APIController:
@@ -87,44 +107,9 @@ T = TypeVar("T", bound=APIController)
 ARG = ParamSpec("ARG")
 RET = TypeVar("RET")
 
-SetIntStr = Set[Union[int, str]]
-DictIntStrAny = Dict[Union[int, str], Any]
-
-
-@dataclass
-class RouteArgs:
-    """The arguments APIRouter.add_api_route takes.
-    Just a convenience for type safety and so we can pass all the args needed by the underlying FastAPI route args via
-    `**dataclasses.asdict(some_args)`.
-    """
-
-    path: str
-    response_model: Optional[Type[Any]] = None
-    status_code: Optional[int] = None
-    tags: Optional[List[str]] = None
-    dependencies: Optional[Sequence[Depends]] = None
-    summary: Optional[str] = None
-    description: Optional[str] = None
-    response_description: str = "Successful Response"
-    responses: Optional[Dict[Union[int, str], Dict[str, Any]]] = None
-    deprecated: Optional[bool] = None
-    methods: Optional[Union[Set[str], List[str]]] = None
-    operation_id: Optional[str] = None
-    response_model_include: Optional[Union[SetIntStr, DictIntStrAny]] = None
-    response_model_exclude: Optional[Union[SetIntStr, DictIntStrAny]] = None
-    response_model_by_alias: bool = True
-    response_model_exclude_unset: bool = False
-    response_model_exclude_defaults: bool = False
-    response_model_exclude_none: bool = False
-    include_in_schema: bool = True
-    response_class: Union[Type[Response], DefaultPlaceholder] = Default(JSONResponse)
-    name: Optional[str] = None
-    route_class_override: Optional[Type[APIRoute]] = None
-    callbacks: Optional[List[Route]] = None
-    openapi_extra: Optional[Dict[str, Any]] = None
-
-    class Config:
-        arbitrary_types_allowed = True
+# The arguments APIRouter.add_api_route takes, stored on each endpoint as
+# `(method, path, kwargs)` and passed straight through on registration
+EndpointArgs = Tuple[str, str, Dict[str, Any]]
 
 
 def get(
@@ -132,7 +117,7 @@ def get(
     **kwargs: Dict[str, Any],
 ) -> Callable[[Callable[ARG, RET]], Callable[ARG, RET]]:
     def decorator(fn: Callable[ARG, RET]):
-        endpoint = RouteArgs(path=path, methods=["GET"], **kwargs)
+        endpoint: EndpointArgs = ("GET", path, kwargs)
         setattr(fn, ENDPOINT_KEY, endpoint)
         return fn
 
@@ -144,7 +129,7 @@ def post(
     **kwargs: Dict[str, Any],
 ) -> Callable[[Callable[ARG, RET]], Callable[ARG, RET]]:
     def decorator(fn: Callable[ARG, RET]):
-        endpoint = RouteArgs(path=path, methods=["POST"], **kwargs)
+        endpoint: EndpointArgs = ("POST", path, kwargs)
         setattr(fn, ENDPOINT_KEY, endpoint)
         return fn
 
@@ -156,7 +141,7 @@ def put(
     **kwargs: Dict[str, Any],
 ) -> Callable[[Callable[ARG, RET]], Callable[ARG, RET]]:
     def decorator(fn: Callable[ARG, RET]):
-        endpoint = RouteArgs(path=path, methods=["PUT"], **kwargs)
+        endpoint: EndpointArgs = ("PUT", path, kwargs)
         setattr(fn, ENDPOINT_KEY, endpoint)
         return fn
 
@@ -168,7 +153,7 @@ def patch(
     **kwargs: Dict[str, Any],
 ) -> Callable[[Callable[ARG, RET]], Callable[ARG, RET]]:
     def decorator(fn: Callable[ARG, RET]):
-        endpoint = RouteArgs(path=path, methods=["PATCH"], **kwargs)
+        endpoint: EndpointArgs = ("PATCH", path, kwargs)
         setattr(fn, ENDPOINT_KEY, endpoint)
         return fn
 
@@ -180,7 +165,7 @@ def delete(
     **kwargs: Dict[str, Any],
 ) -> Callable[[Callable[ARG, RET]], Callable[ARG, RET]]:
     def decorator(fn: Callable[ARG, RET]):
-        endpoint = RouteArgs(path=path, methods=["DELETE"], **kwargs)
+        endpoint: EndpointArgs = ("DELETE", path, kwargs)
         setattr(fn, ENDPOINT_KEY, endpoint)
         return fn
 
@@ -230,7 +215,7 @@ def controller(
     >>>     async def get_users(self, user_id: str = Path(...)):
     >>>         return await self.user_service.get_by_id(user_id)
     """
-    router = APIControllerRouter(
+    router_kwargs: Dict[str, Any] = dict(
         prefix=prefix,
         tags=tags,
         dependencies=dependencies,
@@ -250,50 +235,107 @@ def controller(
     )
 
     def decorator(cls: Type[T]) -> Type[T]:
-        setattr(cls, "get_router", lambda: router)
-        if not router.tags:
-            tag = cls.__name__
-            if tag.endswith("Controller"):
-                tag = tag[:-10]
-            router.tags.append(tag)
-        # inject the underlying router in the class
-        return _controller(router, cls)
+        cls = _controller(cls)
+
+        def build_router() -> APIControllerRouter:
+            router = APIControllerRouter(**router_kwargs)
+            if not router.tags:
+                tag = cls.__name__.removesuffix("Controller") or cls.__name__
+                router.tags = [tag]
+            _add_endpoints(router, cls)
+            # stored on the controller itself, so subclasses share its router
+            setattr(cls, ROUTER_KEY, router)
+            return router
+
+        # inject the underlying router in the class, it is built by
+        # `build_router` the first time `get_router` is called
+        setattr(cls, ROUTER_KEY, build_router)
+        setattr(cls, "get_router", classmethod(_get_router))
+        return cls
 
     return decorator
 
 
-def _controller(router: APIRouter, cls: Type[T]) -> Type[T]:
+def _get_router(cls: Type[APIController]) -> APIControllerRouter:
     """
-    Replaces any methods of the provided class `cls` that are endpoints
-    with updated function calls that will properly inject an instance of
-    `cls`
+    Returns the router of the controller `cls`. The router is built, and the
+    endpoints are registered on it, the first time it is requested, so
+    controllers that are never added to a FastAPI instance do not pay for it
+    """
+    router = getattr(cls, ROUTER_KEY)
+    if not isinstance(router, APIControllerRouter):
+        router = router()
+    return router
+
+
+def _controller(cls: Type[T]) -> Type[T]:
+    """
+    Makes the provided class `cls` constructor based injectable and
+    registers it as a controller
     """
     # Make this class constructor based injectable
     wrapper = inject()
     cls = wrapper(cls)
 
-    # get all functions from cls
-    function_members = getmembers(cls, isfunction)
-    functions_set = set(func for _, func in function_members)
+    # register the controller
+    __controllers__.append(cls)
+    return cls
+
 
-    # filter to get only endpoints
-    endpoints = [f for f in functions_set if getattr(f, ENDPOINT_KEY, None) is not None]
+def _add_endpoints(router: APIRouter, cls: Type[T]) -> None:
+    """
+    Replaces any methods of the provided class `cls` that are endpoints
+    with updated function calls that will properly inject an instance of
+    `cls` and adds them to the `router`
+    """
+    # get all endpoints from cls and its bases, resolved by name as attribute
+    # lookup does but kept in definition order, base classes first, so the
+    # order the routes are matched in does not depend on the class hierarchy
+    members: Dict[str, Any] = {}
+    for klass in reversed(cls.__mro__):
+        if klass not in (APIController, object):
+            members.update(klass.__dict__)
+    endpoints = [
+        f
+        for f in members.values()
+        if isfunction(f) and getattr(f, ENDPOINT_KEY, None) is not None
+    ]
 
+    # bind the lookups done for every endpoint to locals
+    fix_endpoint_signature = _fix_endpoint_signature
+    add_api_route = router.add_api_route
     for endpoint in endpoints:
-        _fix_endpoint_signature(cls, endpoint)
+        fix_endpoint_signature(cls, endpoint)
         # Add the corrected function to the router
-        args: RouteArgs = getattr(endpoint, ENDPOINT_KEY)
-        router.add_api_route(endpoint=endpoint, **asdict(args))
+        method, path, kwargs = getattr(endpoint, ENDPOINT_KEY)
+        add_api_route(path, endpoint, methods=[method], **kwargs)
 
-    # register the router
-    __controllers__.append(cls)
-    return cls
+
+@lru_cache(maxsize=None)
+def _endpoint_signature(endpoint: Callable[..., Any]) -> Signature:
+    # The original signature of an endpoint never changes, so it is computed
+    # only once even if the endpoint is inherited by several controllers
+    return signature(endpoint)
+
+
+@lru_cache(maxsize=None)
+def _self_only_signature(cls: Type[Any], old_signature: Signature) -> Signature:
+    # Endpoints that only take `self` end up with the same signature, so it
+    # is built once per controller and original signature and then shared
+    (old_self_parameter,) = old_signature.parameters.values()
+    new_self_parameter = old_self_parameter.replace(
+        default=Depends(compile_factory(cls))
+    )
+    return old_signature.replace(parameters=[new_self_parameter])
 
 
 def _fix_endpoint_signature(cls: Type[Any], endpoint: Callable[..., Any]) -> None:
-    old_signature = signature(endpoint)
-    old_parameters: List[Parameter] = list(old_signature.parameters.values())
-    old_first_parameter = old_parameters[0]
+    old_signature = _endpoint_signature(endpoint)
+    if len(old_signature.parameters) == 1:
+        setattr(endpoint, "__signature__", _self_only_signature(cls, old_signature))
+        return
+    old_parameters = iter(old_signature.parameters.values())
+    old_first_parameter = next(old_parameters)
 
     # Here we replace the function signature from:
     # >>> Class Test:
@@ -304,25 +346,43 @@ def _fix_endpoint_signature(cls: Type[Any], endpoint: Callable[..., Any]) -> Non
 
     # >>> Class Test:
     # >>>   @post('/')
-    # >>>   async def do_something(self = Depends(factory(Test)), item: Item):
+    # >>>   async def do_something(self = Depends(compile_factory(Test)), item: Item):
     # >>>       ...
 
     # With this new signature, FastAPI will instantiate the self argument
-    # with each HTTP method call, and because of the `factory(cls)` returns
+    # with each HTTP method call, and because of the `compile_factory(cls)` returns
     # a parameterless function, FastAPI will know that this does not require
     # any dependency and will not document it.
     # For this to work, `cls` must effectively be wrapped on inject,
     # so it tries to inject all the constructor arguments at runtime
-    new_self_parameter = old_first_parameter.replace(default=Depends(factory(cls)))
-    new_parameters = [new_self_parameter] + [
-        parameter.replace(kind=Parameter.KEYWORD_ONLY)
-        for parameter in old_parameters[1:]
-    ]
+    new_self_parameter = old_first_parameter.replace(
+        default=Depends(compile_factory(cls))
+    )
+    new_parameters = [new_self_parameter]
+    new_parameters.extend(
+        Parameter(
+            parameter.name,
+            Parameter.KEYWORD_ONLY,
+            default=parameter.default,
+            annotation=parameter.annotation,
+        )
+        for parameter in old_parameters
+    )
 
     new_signature = old_signature.replace(parameters=new_parameters)
     setattr(endpoint, "__signature__", new_signature)
 
 
+def _warmup(controller: Type[T]) -> None:
+    """
+    Checks the dependency graph of `controller` by resolving its constructor
+    dependencies once, so a missing registration fails at startup instead
+    of on the first request. The controller itself is not instantiated, and
+    since services are not cached each request still builds its own
+    """
+    resolve_dependencies(controller)
+
+
 def add_controller(
     api: FastAPI,
     controller: Type[T],
@@ -338,6 +398,7 @@ def add_controller(
     generate_unique_id_function: Callable[[APIRoute], str] = Default(
         generate_unique_id
     ),
+    warmup: bool = False,
 ) -> None:
     api.include_router(
         controller.get_router(),
@@ -351,6 +412,8 @@ def add_controller(
         callbacks=callbacks,
         generate_unique_id_function=generate_unique_id_function,
     )
+    if warmup:
+        _warmup(controller)
 
 
 def add_controllers(
@@ -367,17 +430,22 @@ def add_controllers(
     generate_unique_id_function: Callable[[APIRoute], str] = Default(
         generate_unique_id
     ),
+    warmup: bool = False,
 ) -> None:
+    if not __controllers__:
+        return
+    include_kwargs: Dict[str, Any] = dict(
+        prefix=prefix,
+        tags=tags,
+        dependencies=dependencies,
+        responses=responses,
+        deprecated=deprecated,
+        include_in_schema=include_in_schema,
+        default_response_class=default_response_class,
+        callbacks=callbacks,
+        generate_unique_id_function=generate_unique_id_function,
+    )
     for controller in __controllers__:
-        api.include_router(
-            controller.get_router(),
-            prefix=prefix,
-            tags=tags,
-            dependencies=dependencies,
-            responses=responses,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            default_response_class=default_response_class,
-            callbacks=callbacks,
-            generate_unique_id_function=generate_unique_id_function,
-        )
+        api.include_router(controller.get_router(), **include_kwargs)
+        if warmup:
+            _warmup(controller)
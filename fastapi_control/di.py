@@ -1,7 +1,11 @@
-from typing import Any, Callable, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from kink import Container
 from kink import inject as kink_inject
+from kink.errors import ExecutionError
+from kink.inject import Undefined, _inspect_function_arguments
 
 T = TypeVar("T")
 S = TypeVar("S")
@@ -17,30 +21,115 @@ class _Container(Container):
     is used, the use_factory param is ignored.
     """
 
-    def __getitem__(self, key: Union[str, Type]) -> Any:
-        if key in self._aliases:
-            key = self._aliases[key][0]
+    def __init__(self) -> None:
+        super().__init__()
+        # Each alias mapped to the key it resolves to, kept up to date on
+        # registration so resolving a key takes a single dict lookup
+        self._alias_targets: Dict[Union[str, Type], Union[str, Type]] = {}
+
+    def add_alias(self, name: Union[str, Type], target: Union[str, Type]) -> None:
+        super().add_alias(name, target)
+        self._alias_targets.setdefault(name, target)
 
-        return Container.__getitem__(self, key)
+    def __getitem__(self, key: Union[str, Type]) -> Any:
+        return Container.__getitem__(self, self._alias_targets.get(key, key))
 
 
 _di = _Container()
 
 
+@lru_cache(maxsize=None)
+def _kink_wrapper(alias: Optional[Type[Any]]) -> Callable[[Type[T]], Type[T]]:
+    # The kink decorator only depends on the alias, so it is shared by every
+    # class injected with the same one
+    return (
+        kink_inject(use_factory=True, container=_di)
+        if alias is None
+        else kink_inject(alias=alias, use_factory=True, container=_di)
+    )
+
+
 def inject(alias: Optional[Type[Any]] = None) -> Callable[[Type[T]], Type[T]]:
     def decorator(cls: Type[T]) -> Type[T]:
-        wrapper = (
-            kink_inject(use_factory=True, container=_di)
-            if alias is None
-            else kink_inject(alias=alias, use_factory=True, container=_di)
-        )
-        return wrapper(cls)  # type: ignore
+        return _kink_wrapper(alias)(cls)  # type: ignore
 
     return decorator
 
 
+@lru_cache(maxsize=None)
 def factory(f: Callable[..., T]) -> Callable[[], T]:
-    return lambda: f()
+    # Memoized so every endpoint of a controller shares the same dependency
+    # callable, which is what FastAPI uses as the key of its dependency cache
+    def _factory() -> T:
+        return f()
+
+    _factory.__name__ = f.__name__
+    return _factory
+
+
+def _constructor_arguments(cls: Type[Any]) -> List[Tuple[str, Any, Any]]:
+    """
+    Returns the name, type and default of each constructor argument of
+    `cls`, other than `self` and the variadic ones. The arguments are
+    inspected by kink, so forward references are resolved as kink does.
+    """
+    init = cls.__init__
+    kinds = signature(init).parameters
+    _, arguments = _inspect_function_arguments(init)
+    return [
+        (name, argument.type, argument.default)
+        for name, argument in list(arguments.items())[1:]
+        if kinds[name].kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+    ]
+
+
+def _resolve_arguments(arguments: List[Tuple[str, Any, Any]]) -> Dict[str, Any]:
+    # Same resolution order as kink: by name, then by type, then the default
+    kwargs: Dict[str, Any] = {}
+    missing: List[str] = []
+    for name, type_, default in arguments:
+        if name in _di:
+            kwargs[name] = _di[name]
+        elif type_ in _di:
+            kwargs[name] = _di[type_]
+        elif default is not Undefined:
+            kwargs[name] = default
+        else:
+            missing.append(name)
+    if missing:
+        names = "`, `".join(missing)
+        raise ExecutionError(
+            "Cannot execute function without required parameters. "
+            + f"Did you forget to bind the following parameters: `{names}`?"
+        )
+    return kwargs
+
+
+@lru_cache(maxsize=None)
+def compile_factory(cls: Type[T]) -> Callable[[], T]:
+    """
+    Returns a parameterless function that instantiates the injectable class
+    `cls`, resolving its constructor arguments from the container the same
+    way kink does. The arguments are inspected only once, so each call only
+    looks up the dependencies in the container.
+    """
+    arguments = _constructor_arguments(cls)
+
+    def _factory() -> T:
+        return cls(**_resolve_arguments(arguments))
+
+    _factory.__name__ = cls.__name__
+    return _factory
+
+
+def resolve_dependencies(cls: Type[Any]) -> None:
+    """
+    Resolves every constructor argument of the injectable class `cls` from
+    the container, the same way kink does, without instantiating `cls`.
+    Each dependency is built along with its own dependencies, so any of
+    them that can not be resolved raises here.
+    """
+    _resolve_arguments(_constructor_arguments(cls))
 
 
 def instantiate(f: Callable[..., T]) -> T:
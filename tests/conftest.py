@@ -0,0 +1,12 @@
+import pytest
+
+from fastapi_control.controller import __controllers__
+
+
+@pytest.fixture(autouse=True)
+def restore_controllers():
+    # Controllers register themselves globally when they are decorated, so
+    # the ones defined by a test are removed once it finishes
+    controllers = list(__controllers__)
+    yield
+    __controllers__[:] = controllers
@@ -0,0 +1,61 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_control import APIController, add_controller, controller, get
+
+
+class UserEndpoints:
+    @get("/me")
+    def get_me(self):
+        return "me"
+
+    @get("/{user_id}")
+    def get_by_id(self, user_id: str):
+        return {"id": user_id}
+
+
+def test_endpoints_are_registered_in_definition_order():
+    @controller(prefix="/users")
+    class UsersController(APIController):
+        @get("/me")
+        def get_me(self):
+            return "me"
+
+        @get("/{user_id}")
+        def get_by_id(self, user_id: str):
+            return {"id": user_id}
+
+    paths = [route.path for route in UsersController.get_router().routes]
+    assert paths == ["/users/me", "/users/{user_id}"]
+
+
+def test_inherited_endpoints_keep_definition_order():
+    @controller(prefix="/members")
+    class MembersController(UserEndpoints, APIController):
+        @get("/count")
+        def get_count(self):
+            return 0
+
+    paths = [route.path for route in MembersController.get_router().routes]
+    assert paths == ["/members/me", "/members/{user_id}", "/members/count"]
+
+    api = FastAPI()
+    add_controller(api, MembersController)
+    client = TestClient(api)
+    assert client.get("/members/me").json() == "me"
+    assert client.get("/members/42").json() == {"id": "42"}
+
+
+def test_overridden_endpoint_keeps_base_position():
+    @controller(prefix="/admins")
+    class AdminsController(UserEndpoints, APIController):
+        @get("/me")
+        def get_me(self):
+            return "admin"
+
+    paths = [route.path for route in AdminsController.get_router().routes]
+    assert paths == ["/admins/me", "/admins/{user_id}"]
+
+    api = FastAPI()
+    add_controller(api, AdminsController)
+    assert TestClient(api).get("/admins/me").json() == "admin"
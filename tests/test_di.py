@@ -0,0 +1,60 @@
+import pytest
+from kink.errors import ExecutionError
+
+from fastapi_control.di import _di, compile_factory, inject
+
+
+class GreeterAbstraction:
+    pass
+
+
+@inject(alias=GreeterAbstraction)
+class GreeterImplementation(GreeterAbstraction):
+    pass
+
+
+def test_compile_factory_resolves_alias():
+    @inject()
+    class AliasConsumer:
+        def __init__(self, greeter: GreeterAbstraction) -> None:
+            self.greeter = greeter
+
+    consumer = compile_factory(AliasConsumer)()
+    assert isinstance(consumer.greeter, GreeterImplementation)
+
+
+def test_compile_factory_uses_default_of_unregistered_argument():
+    @inject()
+    class DefaultConsumer:
+        def __init__(self, retries: int = 3) -> None:
+            self.retries = retries
+
+    assert compile_factory(DefaultConsumer)().retries == 3
+
+
+def test_compile_factory_prefers_name_registered_in_container():
+    @inject()
+    class NameConsumer:
+        def __init__(self, compile_factory_greeter: GreeterAbstraction) -> None:
+            self.greeter = compile_factory_greeter
+
+    factory = compile_factory(NameConsumer)
+    assert isinstance(factory().greeter, GreeterImplementation)
+
+    # registered after the factory was compiled
+    _di["compile_factory_greeter"] = "registered by name"
+    assert factory().greeter == "registered by name"
+
+
+def test_compile_factory_raises_execution_error_on_missing_dependency():
+    class MissingService:
+        pass
+
+    @inject()
+    class MissingConsumer:
+        def __init__(self, service: MissingService) -> None:
+            self.service = service
+
+    factory = compile_factory(MissingConsumer)
+    with pytest.raises(ExecutionError, match="`service`"):
+        factory()
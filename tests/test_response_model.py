@@ -0,0 +1,53 @@
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_control import APIController, add_controller, controller, get
+
+
+class Item(BaseModel):
+    name: str
+
+
+class ItemInDB(Item):
+    secret: str
+
+
+def test_response_model_strips_fields_of_subclass_instances():
+    @controller(prefix="/items")
+    class ItemController(APIController):
+        @get("/first", response_model=Item)
+        def first(self):
+            return ItemInDB(name="first", secret="hidden")
+
+        @get("/second", response_model=Item)
+        def second(self):
+            return ItemInDB(name="second", secret="hidden")
+
+    api = FastAPI()
+    add_controller(api, ItemController)
+    client = TestClient(api)
+    assert client.get("/items/first").json() == {"name": "first"}
+    assert client.get("/items/second").json() == {"name": "second"}
+
+
+def test_custom_unique_id_function_sees_response_model():
+    def unique_id(route: APIRoute) -> str:
+        return f"{route.name}_{route.response_model.__name__}"
+
+    @controller(prefix="/ids", generate_unique_id_function=unique_id)
+    class IdController(APIController):
+        @get("/a", response_model=Item)
+        def a(self):
+            return Item(name="a")
+
+        @get("/b", response_model=Item)
+        def b(self):
+            return Item(name="b")
+
+    api = FastAPI()
+    add_controller(api, IdController)
+    paths = api.openapi()["paths"]
+    assert paths["/ids/a"]["get"]["operationId"] == "a_Item"
+    assert paths["/ids/b"]["get"]["operationId"] == "b_Item"
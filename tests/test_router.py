@@ -0,0 +1,71 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_control.controller import APIControllerRouter
+
+
+def make_router() -> APIControllerRouter:
+    router = APIControllerRouter(prefix="/items")
+
+    @router.get("/a")
+    def get_a():
+        return "a"
+
+    @router.get("/b/")
+    def get_b():
+        return "b"
+
+    @router.get("/")
+    def get_root():
+        return "root"
+
+    return router
+
+
+def make_app(prefix: str = "") -> FastAPI:
+    api = FastAPI()
+    if prefix:
+        outer = APIRouter()
+        outer.include_router(make_router(), prefix=prefix)
+        api.include_router(outer)
+    else:
+        api.include_router(make_router())
+    return api
+
+
+@pytest.mark.parametrize("prefix", ["", "/api"])
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("/items/a", "a"),
+        ("/items/a/", "a"),
+        ("/items/b", "b"),
+        ("/items/b/", "b"),
+        ("/items/", "root"),
+    ],
+)
+def test_routes_match_with_and_without_trailing_slash(prefix, path, body):
+    client = TestClient(make_app(prefix))
+    response = client.get(prefix + path, allow_redirects=False)
+    assert response.status_code == 200
+    assert response.json() == body
+
+
+@pytest.mark.parametrize("prefix", ["", "/api"])
+def test_root_route_redirects_the_path_without_slash(prefix):
+    client = TestClient(make_app(prefix))
+    response = client.get(prefix + "/items", allow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"].endswith(prefix + "/items/")
+
+
+@pytest.mark.parametrize("prefix", ["", "/api"])
+def test_schema_only_includes_paths_without_trailing_slash(prefix):
+    paths = make_app(prefix).openapi()["paths"]
+    assert list(paths) == [prefix + "/items/a", prefix + "/items/b"]
+
+
+def test_single_route_per_endpoint():
+    router = make_router()
+    assert len(router.routes) == 3
@@ -0,0 +1,105 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from kink.errors import ExecutionError
+
+from fastapi_control import (
+    APIController,
+    add_controller,
+    add_controllers,
+    controller,
+    get,
+    inject,
+)
+
+
+class MissingService:
+    pass
+
+
+def test_warmup_resolves_dependencies_without_instantiating_controller():
+    built = []
+
+    @inject()
+    class WarmupService:
+        def __init__(self) -> None:
+            built.append(WarmupService)
+
+    @controller(prefix="/warmup")
+    class WarmupController(APIController):
+        def __init__(self, service: WarmupService) -> None:
+            built.append(WarmupController)
+
+        @get("")
+        def index(self):
+            return "ok"
+
+    add_controller(FastAPI(), WarmupController, warmup=True)
+    assert built == [WarmupService]
+
+
+def test_warmup_fails_on_missing_dependency():
+    @controller(prefix="/missing")
+    class MissingController(APIController):
+        def __init__(self, service: MissingService) -> None:
+            self.service = service
+
+        @get("")
+        def index(self):
+            return "ok"
+
+    with pytest.raises(ExecutionError, match="`service`"):
+        add_controller(FastAPI(), MissingController, warmup=True)
+
+
+def test_add_controllers_warmup_resolves_every_controller():
+    built = []
+
+    @inject()
+    class FirstService:
+        def __init__(self) -> None:
+            built.append(FirstService)
+
+    @inject()
+    class SecondService:
+        def __init__(self) -> None:
+            built.append(SecondService)
+
+    @controller(prefix="/first")
+    class FirstController(APIController):
+        def __init__(self, service: FirstService) -> None:
+            self.service = service
+
+    @controller(prefix="/second")
+    class SecondController(APIController):
+        def __init__(self, service: SecondService) -> None:
+            self.service = service
+
+    add_controllers(FastAPI(), warmup=True)
+    assert FirstService in built and SecondService in built
+
+
+def test_no_warmup_by_default():
+    built = []
+
+    @inject()
+    class LazyService:
+        def __init__(self) -> None:
+            built.append(LazyService)
+
+    @controller(prefix="/lazy")
+    class LazyController(APIController):
+        def __init__(self, service: LazyService, missing: MissingService) -> None:
+            self.service = service
+
+        @get("")
+        def index(self):
+            return "ok"
+
+    api = FastAPI()
+    add_controller(api, LazyController)
+    assert built == []
+
+    with pytest.raises(ExecutionError, match="`missing`"):
+        TestClient(api).get("/lazy")
+    assert built == [LazyService]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_control import APIController, add_controller, controller, get, inject
+
+
+@inject()
+class PostponedService:
+    def greet(self) -> str:
+        return "Hello, world!"
+
+
+def test_warmup_resolves_postponed_annotations():
+    @controller(prefix="/postponed")
+    class PostponedController(APIController):
+        def __init__(self, service: PostponedService) -> None:
+            self.service = service
+
+        @get("")
+        def index(self):
+            return self.service.greet()
+
+    api = FastAPI()
+    add_controller(api, PostponedController, warmup=True)
+    assert TestClient(api).get("/postponed").json() == "Hello, world!"